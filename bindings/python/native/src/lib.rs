@@ -0,0 +1,320 @@
+//! PyO3 fast path for the ZKProv Python bindings.
+//!
+//! Mirrors the ctypes surface in `zkprov/__init__.py` (`bootstrap` for the
+//! listings, `prove`, `verify`) but converts arguments and results
+//! natively: strings are borrowed straight from the Python objects, proofs are
+//! copied once into `bytes`, and the listing JSON is parsed with `serde_json`
+//! without an intermediate `str`. Prove/verify metadata is read from the
+//! runtime's fixed-layout structs and returned as plain tuples, which the
+//! Python package wraps in its `ProveMeta`/`VerifyMeta`.
+//! `prove` and `verify` release the GIL while the runtime works, so Python
+//! threads can prove in parallel.
+
+use std::ffi::{c_char, CStr, CString};
+use std::fmt::Write as _;
+use std::ptr;
+use std::slice;
+
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyDict, PyList, PyType};
+use serde_json::{json, Map, Value};
+
+use zkprov::{
+    zkp_bootstrap, zkp_free, zkp_prove_into, zkp_verify_into, ZkpProveMeta, ZkpVerifyMeta,
+    ZKP_ERR_BACKEND, ZKP_ERR_INTERNAL, ZKP_ERR_INVALID_ARG, ZKP_ERR_PROFILE, ZKP_ERR_PROOF_CORRUPT,
+    ZKP_ERR_VERIFY_FAIL, ZKP_OK,
+};
+
+/// NUL-terminated copies of the string arguments shared by prove/verify.
+struct CConfig {
+    backend_id: CString,
+    field: CString,
+    hash_id: CString,
+    profile_id: CString,
+    air_path: CString,
+    public_inputs_json: CString,
+}
+
+impl CConfig {
+    fn new(
+        backend_id: &str,
+        field: &str,
+        hash_id: &str,
+        profile_id: &str,
+        air_path: &str,
+        public_inputs_json: &str,
+    ) -> PyResult<Self> {
+        Ok(Self {
+            backend_id: cstring("backend_id", backend_id)?,
+            field: cstring("field", field)?,
+            hash_id: cstring("hash_id", hash_id)?,
+            profile_id: cstring("profile_id", profile_id)?,
+            air_path: cstring("air_path", air_path)?,
+            public_inputs_json: cstring("public_inputs_json", public_inputs_json)?,
+        })
+    }
+}
+
+/// Status and out-parameters of a prove/verify call, handed back from the
+/// `allow_threads` closure.
+struct RawOut {
+    code: i32,
+    proof: *mut u8,
+    proof_len: u64,
+    meta: ZkpProveMeta,
+}
+
+impl Default for RawOut {
+    fn default() -> Self {
+        Self {
+            code: ZKP_OK,
+            proof: ptr::null_mut(),
+            proof_len: 0,
+            meta: ZkpProveMeta::default(),
+        }
+    }
+}
+
+// SAFETY: the proof pointer is a runtime allocation owned solely by this
+// value; it only moves from the GIL-free closure back to the calling thread.
+unsafe impl Send for RawOut {}
+
+fn cstring(name: &str, value: &str) -> PyResult<CString> {
+    CString::new(value)
+        .map_err(|_| PyValueError::new_err(format!("{name} must not contain NUL bytes")))
+}
+
+/// Parse and release a JSON string allocated by the prover runtime.
+///
+/// # Safety
+///
+/// `ptr` must be NULL or a NUL-terminated string returned by a `zkp_*` call
+/// that has not been freed yet.
+unsafe fn take_json(ptr: *mut c_char) -> PyResult<Value> {
+    if ptr.is_null() {
+        return Ok(Value::Object(Map::new()));
+    }
+    let parsed = serde_json::from_slice(CStr::from_ptr(ptr).to_bytes());
+    zkp_free(ptr.cast());
+    parsed.map_err(|e| PyRuntimeError::new_err(format!("Invalid JSON from native: {e}")))
+}
+
+/// Copy a runtime-allocated proof buffer into `bytes` and release it.
+///
+/// # Safety
+///
+/// `ptr` must be NULL or reference at least `len` bytes returned by
+/// `zkp_prove` that have not been freed yet.
+unsafe fn take_bytes<'py>(py: Python<'py>, ptr: *mut u8, len: u64) -> Bound<'py, PyBytes> {
+    if ptr.is_null() {
+        return PyBytes::new_bound(py, &[]);
+    }
+    let bytes = PyBytes::new_bound(py, slice::from_raw_parts(ptr, len as usize));
+    zkp_free(ptr.cast());
+    bytes
+}
+
+fn json_to_py(py: Python<'_>, value: &Value) -> PyResult<PyObject> {
+    Ok(match value {
+        Value::Null => py.None(),
+        Value::Bool(b) => (*b).into_py(py),
+        Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.into_py(py)
+            } else if let Some(u) = n.as_u64() {
+                u.into_py(py)
+            } else {
+                n.as_f64().unwrap_or(f64::NAN).into_py(py)
+            }
+        }
+        Value::String(s) => s.as_str().into_py(py),
+        Value::Array(items) => {
+            let list = PyList::empty_bound(py);
+            for item in items {
+                list.append(json_to_py(py, item)?)?;
+            }
+            list.into_any().unbind()
+        }
+        Value::Object(map) => {
+            let dict = PyDict::new_bound(py);
+            for (key, item) in map {
+                dict.set_item(key, json_to_py(py, item)?)?;
+            }
+            dict.into_any().unbind()
+        }
+    })
+}
+
+static ZKP_ERROR: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+
+/// Name of a `ZKP_ERR_*` code as spelled in `zkprov.h`.
+fn error_name(code: i32) -> &'static str {
+    match code {
+        ZKP_ERR_INVALID_ARG => "InvalidArg",
+        ZKP_ERR_BACKEND => "Backend",
+        ZKP_ERR_PROFILE => "Profile",
+        ZKP_ERR_PROOF_CORRUPT => "ProofCorrupt",
+        ZKP_ERR_VERIFY_FAIL => "VerifyFail",
+        ZKP_ERR_INTERNAL => "Internal",
+        _ => "Unknown",
+    }
+}
+
+/// Raise `zkprov.ZkpError`, the same exception the ctypes path raises. Without
+/// an envelope `msg` falls back to the code's name.
+fn zkp_error(py: Python<'_>, code: i32, payload: &Value) -> PyErr {
+    let field = |key: &str| {
+        payload.get(key).map(|v| {
+            v.as_str()
+                .map(str::to_owned)
+                .unwrap_or_else(|| v.to_string())
+        })
+    };
+    let msg = field("msg").unwrap_or_else(|| error_name(code).to_owned());
+    let detail = field("detail").filter(|d| !d.is_empty());
+    match ZKP_ERROR
+        .import(py, "zkprov", "ZkpError")
+        .and_then(|cls| cls.call1((code, msg, detail)))
+    {
+        Ok(err) => PyErr::from_value_bound(err),
+        Err(err) => err,
+    }
+}
+
+/// `0x`-prefixed lowercase hex, as in the runtime's JSON envelopes.
+fn digest_hex(digest: &[u8; 32]) -> String {
+    let mut out = String::with_capacity(2 + 2 * digest.len());
+    out.push_str("0x");
+    for byte in digest {
+        let _ = write!(out, "{byte:02x}");
+    }
+    out
+}
+
+/// Initialise the runtime and return `(backends, profiles)` in one call.
+#[pyfunction]
+fn bootstrap(py: Python<'_>) -> PyResult<(PyObject, PyObject)> {
+    let mut backends: *mut c_char = ptr::null_mut();
+    let mut profiles: *mut c_char = ptr::null_mut();
+    let code = unsafe { zkp_bootstrap(&mut backends, &mut profiles) };
+    let backends = unsafe { take_json(backends) };
+    let profiles = unsafe { take_json(profiles) };
+    let (backends, profiles) = (backends?, profiles?);
+    if code != ZKP_OK {
+        return Err(zkp_error(
+            py,
+            code,
+            &json!({ "msg": "zkp_bootstrap failed" }),
+        ));
+    }
+    Ok((json_to_py(py, &backends)?, json_to_py(py, &profiles)?))
+}
+
+#[allow(clippy::too_many_arguments)]
+#[pyfunction]
+#[pyo3(signature = (backend_id, field, hash_id, fri_arity, profile_id, air_path, public_inputs_json))]
+fn prove(
+    py: Python<'_>,
+    backend_id: &str,
+    field: &str,
+    hash_id: &str,
+    fri_arity: u32,
+    profile_id: &str,
+    air_path: &str,
+    public_inputs_json: &str,
+) -> PyResult<(PyObject, (String, u64))> {
+    let cfg = CConfig::new(
+        backend_id,
+        field,
+        hash_id,
+        profile_id,
+        air_path,
+        public_inputs_json,
+    )?;
+    // Proving runs without the GIL so other Python threads keep going.
+    let out = py.allow_threads(|| {
+        let mut out = RawOut::default();
+        out.code = unsafe {
+            zkp_prove_into(
+                cfg.backend_id.as_ptr(),
+                cfg.field.as_ptr(),
+                cfg.hash_id.as_ptr(),
+                fri_arity,
+                cfg.profile_id.as_ptr(),
+                cfg.air_path.as_ptr(),
+                cfg.public_inputs_json.as_ptr(),
+                &mut out.proof,
+                &mut out.proof_len,
+                &mut out.meta,
+            )
+        };
+        out
+    });
+    let proof = unsafe { take_bytes(py, out.proof, out.proof_len) };
+    if out.code != ZKP_OK {
+        return Err(zkp_error(py, out.code, &Value::Null));
+    }
+    Ok((
+        proof.into_any().unbind(),
+        (digest_hex(&out.meta.digest), out.meta.proof_len),
+    ))
+}
+
+#[allow(clippy::too_many_arguments)]
+#[pyfunction]
+#[pyo3(signature = (backend_id, field, hash_id, fri_arity, profile_id, air_path, public_inputs_json, proof))]
+fn verify(
+    py: Python<'_>,
+    backend_id: &str,
+    field: &str,
+    hash_id: &str,
+    fri_arity: u32,
+    profile_id: &str,
+    air_path: &str,
+    public_inputs_json: &str,
+    proof: &[u8],
+) -> PyResult<(bool, (String, bool))> {
+    let cfg = CConfig::new(
+        backend_id,
+        field,
+        hash_id,
+        profile_id,
+        air_path,
+        public_inputs_json,
+    )?;
+    let (code, meta) = py.allow_threads(|| {
+        let mut meta = ZkpVerifyMeta::default();
+        let code = unsafe {
+            zkp_verify_into(
+                cfg.backend_id.as_ptr(),
+                cfg.field.as_ptr(),
+                cfg.hash_id.as_ptr(),
+                fri_arity,
+                cfg.profile_id.as_ptr(),
+                cfg.air_path.as_ptr(),
+                cfg.public_inputs_json.as_ptr(),
+                proof.as_ptr(),
+                proof.len() as u64,
+                &mut meta,
+            )
+        };
+        (code, meta)
+    });
+    if code != ZKP_OK {
+        return Err(zkp_error(py, code, &Value::Null));
+    }
+    let verified = meta.verified != 0;
+    Ok((verified, (digest_hex(&meta.digest), verified)))
+}
+
+#[pymodule]
+fn zkprov_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    // No zkp_init here: every entry point initialises the runtime on first
+    // use, so importing the module stays cheap.
+    m.add_function(wrap_pyfunction!(bootstrap, m)?)?;
+    m.add_function(wrap_pyfunction!(prove, m)?)?;
+    m.add_function(wrap_pyfunction!(verify, m)?)?;
+    Ok(())
+}
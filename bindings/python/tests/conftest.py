@@ -0,0 +1,21 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def load_zkprov(monkeypatch):
+    """Import a fresh ``zkprov`` from ``entry`` (the package root by default)."""
+    monkeypatch.setitem(sys.modules, "zkprov_native", None)
+    sys.modules.pop("zkprov", None)
+
+    def load(entry: str = str(PACKAGE_ROOT)):
+        monkeypatch.syspath_prepend(entry)
+        return importlib.import_module("zkprov")
+
+    yield load
+    sys.modules.pop("zkprov", None)
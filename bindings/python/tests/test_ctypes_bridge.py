@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import ctypes
+import gc
+from ctypes import (
+    CFUNCTYPE,
+    POINTER,
+    c_char_p,
+    c_int,
+    c_uint32,
+    c_uint64,
+    c_uint8,
+    c_void_p,
+)
+
+import pytest
+
+PROOF = bytes(range(48))
+DIGEST = bytes(range(100, 132))
+DIGEST_HEX = "0x" + DIGEST.hex()
+
+_CONFIG = (c_char_p, c_char_p, c_char_p, c_uint32, c_char_p, c_char_p, c_char_p)
+_BOOTSTRAP = CFUNCTYPE(c_int, POINTER(c_char_p), POINTER(c_char_p))
+_PROVE = CFUNCTYPE(
+    c_int, *_CONFIG, POINTER(POINTER(c_uint8)), POINTER(c_uint64), c_void_p
+)
+_VERIFY = CFUNCTYPE(c_int, *_CONFIG, POINTER(c_uint8), c_uint64, c_void_p)
+_BATCH = CFUNCTYPE(c_int, c_void_p, c_uint64, c_void_p)
+_FREE = CFUNCTYPE(None, c_void_p)
+
+_CONFIG_FIELDS = [
+    (name, ctype)
+    for name, ctype in zip(
+        (
+            "backend_id",
+            "field",
+            "hash_id",
+            "fri_arity",
+            "profile_id",
+            "air_path",
+            "public_inputs_json",
+        ),
+        _CONFIG,
+    )
+]
+
+
+# Layouts from zkprov.h, kept separate from the package's own definitions.
+class ProveReq(ctypes.Structure):
+    _fields_ = _CONFIG_FIELDS
+
+
+class ProveMeta(ctypes.Structure):
+    _fields_ = [("digest", c_uint8 * 32), ("proof_len", c_uint64)]
+
+
+class VerifyMeta(ctypes.Structure):
+    _fields_ = [("digest", c_uint8 * 32), ("verified", c_uint8)]
+
+
+class ProveResp(ctypes.Structure):
+    _fields_ = [("code", c_int), ("proof", c_void_p), ("meta", ProveMeta)]
+
+
+class VerifyReq(ctypes.Structure):
+    _fields_ = _CONFIG_FIELDS + [("proof", c_void_p), ("proof_len", c_uint64)]
+
+
+class VerifyResp(ctypes.Structure):
+    _fields_ = [("code", c_int), ("meta", VerifyMeta)]
+
+
+def _items(cls, addr: int, n: int):
+    return [cls.from_address(addr + i * ctypes.sizeof(cls)) for i in range(n)]
+
+
+class FakeRuntime:
+    """In-process stand-in for libzkprov built from ctypes callbacks."""
+
+    def __init__(self):
+        self.live = {}
+        self.freed = []
+        self.verified = []
+        self.verify_error = None  # status code to fail verification with
+        self.bootstrap_error = None  # status code to fail zkp_bootstrap with
+        self.bootstraps = 0
+        self.zkp_bootstrap = _BOOTSTRAP(self._bootstrap)
+        self.zkp_prove_into = _PROVE(self._prove)
+        self.zkp_verify_into = _VERIFY(self._verify)
+        self.zkp_prove_batch = _BATCH(self._prove_batch)
+        self.zkp_verify_batch = _BATCH(self._verify_batch)
+        self.batch_calls = 0
+        self.zkp_free = _FREE(self._free)
+
+    def _alloc(self, data: bytes, nul: bool = False) -> int:
+        buf = ctypes.create_string_buffer(data, len(data) + (1 if nul else 0))
+        addr = ctypes.addressof(buf)
+        self.live[addr] = buf
+        return addr
+
+    def _store(self, out, addr: int) -> None:
+        ctypes.cast(out, POINTER(c_void_p))[0] = addr
+
+    def _bootstrap(self, out_backends, out_profiles):
+        self.bootstraps += 1
+        if self.bootstrap_error is not None:
+            self._store(out_backends, 0)
+            self._store(out_profiles, 0)
+            return self.bootstrap_error
+        self._store(out_backends, self._alloc(b'[{"id":"native@0.0"}]', nul=True))
+        self._store(out_profiles, self._alloc(b'[{"id":"balanced"}]', nul=True))
+        return 0
+
+    def _prove(self, *args):
+        out_proof, out_len, out_meta = args[-3:]
+        self._store(out_proof, self._alloc(PROOF))
+        out_len[0] = len(PROOF)
+        meta = ProveMeta.from_address(out_meta)
+        meta.digest[:] = DIGEST
+        meta.proof_len = len(PROOF)
+        return 0
+
+    def _verify(self, *args):
+        proof_ptr, proof_len, out_meta = args[-3:]
+        self.verified.append(
+            (ctypes.cast(proof_ptr, c_void_p).value, ctypes.string_at(proof_ptr, proof_len))
+        )
+        meta = VerifyMeta.from_address(out_meta)
+        if self.verify_error is not None:
+            ctypes.memset(out_meta, 0, ctypes.sizeof(meta))
+            return self.verify_error
+        meta.digest[:] = DIGEST
+        meta.verified = 1
+        return 0
+
+    def _prove_batch(self, reqs, n, out):
+        self.batch_calls += 1
+        for req, resp in zip(_items(ProveReq, reqs, n), _items(ProveResp, out, n)):
+            resp.meta = ProveMeta()
+            if req.profile_id == b"broken":
+                resp.code, resp.proof = 3, None
+                continue
+            proof = PROOF + req.public_inputs_json
+            resp.code = 0
+            resp.proof = self._alloc(proof)
+            resp.meta.digest[:] = DIGEST
+            resp.meta.proof_len = len(proof)
+        return 0
+
+    def _verify_batch(self, reqs, n, out):
+        self.batch_calls += 1
+        for req, resp in zip(_items(VerifyReq, reqs, n), _items(VerifyResp, out, n)):
+            proof = ctypes.string_at(req.proof, req.proof_len)
+            self.verified.append((req.proof, proof))
+            resp.code = 0
+            resp.meta.digest[:] = DIGEST
+            resp.meta.verified = 1
+        return 0
+
+    def _free(self, addr):
+        if addr:
+            self.freed.append(addr)
+            self.live.pop(addr, None)
+
+
+@pytest.fixture
+def bridge(monkeypatch, load_zkprov):
+    monkeypatch.setenv("ZKPROV_LIB", "fake-libzkprov")
+    runtime = FakeRuntime()
+    monkeypatch.setattr(ctypes, "CDLL", lambda path: runtime)
+    return load_zkprov(), runtime
+
+
+def _config(module):
+    return module.ProveConfig(
+        backend_id="native@0.0",
+        field="Prime254",
+        hash_id="blake3",
+        fri_arity=2,
+        profile_id="balanced",
+        air_path="toy.air",
+        public_inputs_json="{}",
+    )
+
+
+def test_proof_roundtrip_shares_native_buffer(bridge):
+    module, runtime = bridge
+    cfg = _config(module)
+    assert module._LIB is None
+
+    proof, meta = module.prove(cfg)
+    assert module._get_lib() is module._LIB
+    assert runtime.bootstraps == 0  # listings are only fetched by list_*
+    assert bytes(proof) == PROOF
+    assert meta == module.ProveMeta(digest=DIGEST_HEX, proof_len=48)
+    assert proof.readonly and proof == PROOF
+    with pytest.raises(TypeError):
+        proof[0] = 1
+    proof_addr = ctypes.addressof(proof.obj)
+    assert proof_addr in runtime.live
+
+    ok, meta2 = module.verify(cfg, proof=proof)
+    assert ok and meta2 == module.VerifyMeta(digest=DIGEST_HEX, verified=True)
+    assert runtime.verified == [(proof_addr, PROOF)]
+    assert proof_addr not in runtime.freed
+
+    del proof
+    gc.collect()
+    assert runtime.freed.count(proof_addr) == 1
+
+
+def test_verify_accepts_plain_bytes(bridge):
+    module, runtime = bridge
+
+    ok, _ = module.verify(_config(module), proof=PROOF)
+    assert ok
+    assert runtime.verified == [(ctypes.cast(PROOF, c_void_p).value, PROOF)]
+
+    ok, _ = module.verify(_config(module), proof=bytearray(PROOF))
+    assert ok
+    assert runtime.verified[-1][1] == PROOF
+
+
+def test_listings_fetched_once(bridge):
+    module, runtime = bridge
+
+    backends = module.list_backends()
+    assert [dict(item) for item in backends] == [{"id": "native@0.0"}]
+    assert module.list_profiles()[0]["id"] == "balanced"
+    assert module.list_backends() is backends
+    with pytest.raises(TypeError):
+        backends[0]["id"] = "other"
+    assert runtime.bootstraps == 1
+    assert not runtime.live  # both listings released after decoding
+
+    module.reset()
+    assert module.list_backends() is not backends
+    assert runtime.bootstraps == 2
+
+
+def test_runtime_errors_raise_zkp_error(bridge):
+    module, runtime = bridge
+    runtime.verify_error = 5
+
+    with pytest.raises(module.ZkpError) as exc:
+        module.verify(_config(module), proof=PROOF)
+    assert isinstance(exc.value, RuntimeError)
+    assert exc.value.code == 5
+    assert exc.value.msg == "VerifyFail"
+    assert str(exc.value) == "[ZKProv err 5] VerifyFail"
+    assert str(module.ZkpError(99)) == "[ZKProv err 99] Unknown"
+
+    runtime.bootstrap_error = 7
+    with pytest.raises(module.ZkpError) as exc:
+        module.list_profiles()
+    assert exc.value.code == 7
+    assert str(exc.value) == "[ZKProv err 7] zkp_bootstrap failed"
+
+    err = module.ZkpError(4, "ProofCorrupt", "bad header")
+    assert (err.code, err.msg, err.detail) == (4, "ProofCorrupt", "bad header")
+    assert str(err) == "[ZKProv err 4] ProofCorrupt (bad header)"
+
+
+def test_prototypes_are_cdecl_without_errno(bridge):
+    module, _ = bridge
+    errno_flags = ctypes._FUNCFLAG_USE_ERRNO | ctypes._FUNCFLAG_USE_LASTERROR
+    for _, sig in module._SIGNATURES:
+        assert sig._flags_ & ctypes._FUNCFLAG_CDECL
+        assert not sig._flags_ & errno_flags
+
+
+def test_batches_cross_the_boundary_once(bridge):
+    module, runtime = bridge
+    cfg = _config(module)
+    fields = {
+        "backend_id": "native@0.0",
+        "field": "Prime254",
+        "hash_id": "blake3",
+        "fri_arity": 2,
+        "profile_id": "balanced",
+        "air_path": "toy.air",
+        "public_inputs_json": '{"n":2}',
+    }
+
+    results = module.prove_many([cfg, fields])
+    assert runtime.batch_calls == 1
+    assert [bytes(proof) for proof, _ in results] == [PROOF + b"{}", PROOF + b'{"n":2}']
+    assert results[1][1] == module.ProveMeta(digest=DIGEST_HEX, proof_len=55)
+
+    checked = module.verify_many(
+        [(cfg, results[0][0]), (fields, bytes(results[1][0]))]
+    )
+    assert runtime.batch_calls == 2
+    assert checked == [(True, module.VerifyMeta(DIGEST_HEX, True))] * 2
+    assert runtime.verified[0] == (ctypes.addressof(results[0][0].obj), PROOF + b"{}")
+    assert module.prove_many([]) == [] and runtime.batch_calls == 2
+
+    with pytest.raises(module.ZkpError) as exc:
+        module.prove_many([cfg, dict(fields, profile_id="broken")])
+    assert exc.value.code == 3
+    del results, checked, exc
+    gc.collect()
+    assert not runtime.live  # proofs from the failed batch were released too
+
+
+def test_meta_structs_match_header_layout(bridge):
+    module, _ = bridge
+    assert ctypes.sizeof(module._ProveMeta) == 40  # uint8_t[32] + uint64_t
+    assert ctypes.sizeof(module._VerifyMeta) == 33  # uint8_t[32] + uint8_t
@@ -1,28 +1,18 @@
-import importlib
+import atexit
 import sys
+import types
+import zipfile
 from pathlib import Path
 
 import ctypes
 
+import pytest
 
-class DummyCallable:
-    def __init__(self, result=0):
-        self._result = result
-        self.restype = None
-        self.argtypes = None
-
-    def __call__(self, *args, **kwargs):  # pragma: no cover - exercised via ctypes usage
-        return self._result
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
 
 
 class DummyLib:
-    def __init__(self):
-        self.zkp_init = DummyCallable(0)
-        self.zkp_list_backends = DummyCallable(0)
-        self.zkp_list_profiles = DummyCallable(0)
-        self.zkp_prove = DummyCallable(0)
-        self.zkp_verify = DummyCallable(0)
-        self.zkp_free = DummyCallable(None)
+    """Stands in for the CDLL handle; the loader never calls into it."""
 
 
 def _expected_library_name() -> str:
@@ -33,18 +23,11 @@ def _expected_library_name() -> str:
     return "libzkprov.so"
 
 
-def test_loads_packaged_library_first(monkeypatch):
+def test_loads_packaged_library_first(monkeypatch, load_zkprov):
     monkeypatch.delenv("ZKPROV_LIB", raising=False)
-    module_name = "zkprov"
-    sys.modules.pop(module_name, None)
-
-    package_root = Path(__file__).resolve().parents[1]
-    sys_path_entry = str(package_root)
-    sys.path.insert(0, sys_path_entry)
 
-    pkg_dir = package_root / "zkprov"
+    pkg_dir = PACKAGE_ROOT / "zkprov"
     expected = pkg_dir / _expected_library_name()
-    expected.write_bytes(b"dummy")
 
     loaded_paths: list[str] = []
 
@@ -57,13 +40,163 @@ def test_loads_packaged_library_first(monkeypatch):
 
     monkeypatch.setattr(ctypes, "CDLL", fake_cdll)
 
-    try:
-        module = importlib.import_module(module_name)
-        assert isinstance(module._LIB, DummyLib)
-        assert loaded_paths[0] == str(expected)
-    finally:
-        sys.modules.pop(module_name, None)
-        if sys.path and sys.path[0] == sys_path_entry:
-            sys.path.pop(0)
-        if expected.exists():
-            expected.unlink()
+    module = load_zkprov()
+    assert module._LIB is None
+    assert loaded_paths == []
+
+    # the lookup itself differs on 3.8 (os.path) and later (importlib.resources)
+    monkeypatch.setattr(module, "_bundled_lib", lambda: str(expected))
+    assert isinstance(module._load_lib(), DummyLib)
+    assert loaded_paths[0] == str(expected)
+    assert module.HERE == str(pkg_dir)
+
+
+def test_prefers_native_extension(monkeypatch, load_zkprov):
+    monkeypatch.delenv("ZKPROV_NO_NATIVE", raising=False)
+
+    native = types.ModuleType("zkprov_native")
+    native.bootstrap = lambda: ([{"id": "native@0.0"}], [{"id": "balanced"}])
+    calls = []
+
+    def native_prove(*args):
+        calls.append(args)
+        return b"native-proof", ("0xabc", 12)
+
+    def native_verify(*args):
+        if not isinstance(args[-1], bytes):  # PyO3 &[u8] accepts bytes only
+            raise TypeError("argument 'proof': expected bytes")
+        calls.append(args)
+        return True, ("0xabc", True)
+
+    native.prove = native_prove
+    native.verify = native_verify
+    monkeypatch.setitem(sys.modules, "zkprov_native", native)
+
+    def fake_cdll(path):
+        raise AssertionError(f"ctypes loader used: {path}")
+
+    monkeypatch.setattr(ctypes, "CDLL", fake_cdll)
+
+    module = load_zkprov()
+    assert module._LIB is None
+    assert module.list_backends()[0]["id"] == "native@0.0"
+    assert module.list_profiles()[0]["id"] == "balanced"
+    cfg = module.ProveConfig(
+        backend_id="native@0.0",
+        field="Prime254",
+        hash_id="blake3",
+        fri_arity=2,
+        profile_id="balanced",
+        air_path="toy.air",
+        public_inputs_json="{}",
+    )
+    proof, meta = module.prove(cfg)
+    assert proof == b"native-proof"
+    assert meta == module.ProveMeta(digest="0xabc", proof_len=12)
+    assert calls[0][0] == "native@0.0"
+    ok, meta = module.verify(cfg, proof=proof)
+    assert ok and meta == module.VerifyMeta(digest="0xabc", verified=True)
+    assert calls[1][-1] == b"native-proof"
+
+    for other in (bytearray(proof), memoryview(proof)):
+        ok, _ = module.verify(cfg, proof=other)
+        assert ok and calls[-1][-1] == b"native-proof"
+    assert module.verify_many([(cfg, bytearray(proof))])[0][0]
+
+
+def test_native_extension_imported_on_first_call(monkeypatch, tmp_path, load_zkprov):
+    monkeypatch.setenv("ZKPROV_NO_NATIVE", "0")  # only "1" opts out
+    monkeypatch.delitem(sys.modules, "zkprov_native")
+    (tmp_path / "zkprov_native.py").write_text(
+        "def bootstrap():\n"
+        "    return [{'id': 'native@0.0'}], [{'id': 'balanced'}]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = load_zkprov()
+    assert "zkprov_native" not in sys.modules
+
+    assert module.list_backends()[0]["id"] == "native@0.0"
+    assert "zkprov_native" in sys.modules
+    sys.modules.pop("zkprov_native")
+
+
+def test_probes_each_candidate_once(monkeypatch, tmp_path, load_zkprov):
+    env_lib = str(tmp_path / _expected_library_name())
+    Path(env_lib).write_bytes(b"")
+    monkeypatch.setenv("ZKPROV_LIB", env_lib)
+
+    loaded_paths: list[str] = []
+
+    def fake_cdll(path):
+        loaded_paths.append(str(path))
+        if str(path) == env_lib:
+            return DummyLib()
+        raise OSError("not found")
+
+    monkeypatch.setattr(ctypes, "CDLL", fake_cdll)
+
+    module = load_zkprov()
+    monkeypatch.setattr(module, "_bundled_lib", lambda: None)
+    assert isinstance(module._load_lib(), DummyLib)
+    assert loaded_paths == [env_lib]
+
+    monkeypatch.setenv("ZKPROV_LIB", module.NAME)
+    assert module._lib_candidates().count(module.NAME) == 1
+
+
+def test_skips_missing_files_without_dlopen(monkeypatch, tmp_path, load_zkprov):
+    missing = tmp_path / "missing" / _expected_library_name()
+    monkeypatch.setenv("ZKPROV_LIB", str(missing))
+
+    loaded_paths: list[str] = []
+
+    def fake_cdll(path):
+        loaded_paths.append(str(path))
+        return DummyLib()
+
+    monkeypatch.setattr(ctypes, "CDLL", fake_cdll)
+
+    module = load_zkprov()
+    monkeypatch.setattr(module, "_bundled_lib", lambda: None)
+    assert isinstance(module._load_lib(), DummyLib)
+    assert loaded_paths == [module.NAME]
+
+
+def test_reports_missing_env_library(monkeypatch, tmp_path, load_zkprov):
+    missing = str(tmp_path / "missing" / _expected_library_name())
+    monkeypatch.setenv("ZKPROV_LIB", missing)
+
+    def fake_cdll(path):
+        raise OSError(f"{path}: cannot open shared object file")
+
+    monkeypatch.setattr(ctypes, "CDLL", fake_cdll)
+
+    module = load_zkprov()
+    monkeypatch.setattr(module, "_bundled_lib", lambda: None)
+    with pytest.raises(OSError, match="ZKPROV_LIB=") as exc:
+        module._load_lib()
+    assert missing in str(exc.value)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="needs importlib.resources.files()"
+)
+def test_bundled_library_extracted_from_zip(monkeypatch, tmp_path, load_zkprov):
+    pkg_dir = PACKAGE_ROOT / "zkprov"
+    archive = tmp_path / "site.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(pkg_dir / "__init__.py", "zkprov/__init__.py")
+        zf.writestr(f"zkprov/{_expected_library_name()}", b"\x7fELF-stub")
+
+    exit_hooks = []
+    monkeypatch.setattr(atexit, "register", exit_hooks.append)
+    module = load_zkprov(str(archive))
+    bundled = module._bundled_lib()
+    assert bundled is not None and not bundled.startswith(str(archive))
+    assert Path(bundled).read_bytes() == b"\x7fELF-stub"
+    assert module._bundled_lib() == bundled
+
+    for hook in exit_hooks:
+        hook()
+    assert not Path(bundled).exists()
@@ -3,7 +3,9 @@ from __future__ import annotations
 import runpy
 import sys
 import types
+from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
@@ -12,17 +14,37 @@ def test_roundtrip_example_runs(capsys):
     script = Path(__file__).resolve().parents[3] / "examples/python/roundtrip.py"
     stub = types.ModuleType("zkprov")
 
+    @dataclass(frozen=True)
+    class ProveConfig:
+        backend_id: str
+        field: str
+        hash_id: str
+        fri_arity: int
+        profile_id: str
+        air_path: str
+        public_inputs_json: str
+
+    class ProveMeta(NamedTuple):
+        digest: str
+        proof_len: int
+
+    class VerifyMeta(NamedTuple):
+        digest: str
+        verified: bool
+
     def list_backends():
         return {"native@0.0": {"field": ["Prime254"]}}
 
-    def prove(**cfg):
-        assert cfg["backend_id"] == "native@0.0"
-        return b"fake-proof", {"digest": "0xabc", "proof_len": 123}
+    def prove(cfg):
+        assert cfg.backend_id == "native@0.0"
+        return b"fake-proof", ProveMeta("0xabc", 123)
 
-    def verify(*, proof, **cfg):
+    def verify(cfg, *, proof):
+        assert isinstance(cfg, ProveConfig)
         assert proof == b"fake-proof"
-        return True, {"digest": "0xabc"}
+        return True, VerifyMeta("0xabc", True)
 
+    stub.ProveConfig = ProveConfig
     stub.list_backends = list_backends
     stub.prove = prove
     stub.verify = verify
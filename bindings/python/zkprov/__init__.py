@@ -1,18 +1,34 @@
 """
-ZKProv Python bindings (ctypes).
+ZKProv Python bindings.
 Public API will expose: list_backends, list_profiles, prove, verify.
+
+On CPython the calls are served by the optional ``zkprov_native`` PyO3
+extension when it is installed; otherwise (and always on PyPy) they go
+through the ctypes bridge below.
 """
 from __future__ import annotations
 
-import json
+import atexit
+import contextlib
+import functools
 import os
 import sys
+import threading
+import weakref
 import ctypes
 
-from pathlib import Path
+from dataclasses import dataclass, field as _dataclass_field
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional, Tuple
+
+try:  # optional speedup: parses bytes directly, no UTF-8 decode step
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from ctypes import (
     CDLL,
+    CFUNCTYPE,
     POINTER,
     c_char_p,
     c_int,
@@ -23,45 +39,138 @@ from ctypes import (
 )
 
 
-__all__ = ["list_backends", "list_profiles", "prove", "verify"]
-HERE = Path(__file__).resolve().parent
+__all__ = [
+    "ProveConfig",
+    "ProveMeta",
+    "VerifyMeta",
+    "ZkpError",
+    "list_backends",
+    "list_profiles",
+    "prove",
+    "prove_many",
+    "reset",
+    "verify",
+    "verify_many",
+]
+# os.path only: unlike Path.resolve() this makes no filesystem calls.
+HERE = os.path.dirname(os.path.abspath(__file__))
 NAME = {"darwin": "libzkprov.dylib", "win32": "zkprov.dll"}.get(
     sys.platform, "libzkprov.so"
 )
 
 
+# Keeps a library extracted from a zipped install alive for the process.
+_RESOURCES = contextlib.ExitStack()
+
+
+def _close_resources() -> None:
+    # Windows cannot delete a DLL that is still loaded; the copy stays then.
+    with contextlib.suppress(OSError):
+        _RESOURCES.close()
+
+
+atexit.register(_close_resources)
+
+
+@functools.lru_cache(maxsize=None)
+def _bundled_lib() -> Optional[str]:
+    """On-disk path of the library shipped inside the package, if any.
+
+    Goes through ``importlib.resources`` so zipped installs work too: the
+    library is then extracted once to a temporary file, reused, and deleted
+    at interpreter exit.
+    """
+    try:
+        from importlib.resources import as_file, files
+    except ImportError:  # Python 3.8
+        resource = os.path.join(HERE, NAME)
+        return resource if os.path.isfile(resource) else None
+    resource = files(__name__).joinpath(NAME)
+    if not resource.is_file():
+        return None
+    return str(_RESOURCES.enter_context(as_file(resource)))
+
+
+def _present(path: Optional[str]) -> bool:
+    # A stat is far cheaper than a dlopen that fails; bare names are left to
+    # the dynamic loader's search path.
+    return bool(path) and (not os.path.dirname(path) or os.path.isfile(path))
+
+
+def _lib_candidates() -> Tuple[str, ...]:
+    """Library locations in probe order, without duplicates or missing files."""
+
+    env = os.environ.get("ZKPROV_LIB")
+    return tuple(
+        dict.fromkeys(
+            path
+            for path in (
+                _bundled_lib(),  # checked by importlib.resources
+                env if _present(env) else None,
+                NAME,  # dynamic loader search path, tried last
+            )
+            if path
+        )
+    )
+
+
 def _load_lib() -> CDLL:
     """Resolve and load the native ZKProv library."""
 
-    bundled = HERE / NAME
-    if bundled.exists():
-        return CDLL(str(bundled))
-
+    error: Optional[OSError] = None
+    for path in _lib_candidates():
+        try:
+            lib = CDLL(path)
+        except OSError as exc:
+            error = exc
+            continue
+        return lib
+    assert error is not None
     env = os.environ.get("ZKPROV_LIB")
-    if env:
-        return CDLL(env)
+    if env and not _present(env):
+        # skipped above without a dlopen; name it rather than the fallback
+        raise OSError(f"ZKPROV_LIB={env!r} does not exist ({error})") from error
+    raise error
 
-    return CDLL(NAME)
 
+def _load_native():
+    """Import the PyO3 extension, or return ``None`` to use ctypes."""
 
-_LIB = _load_lib()
+    if sys.implementation.name != "cpython":
+        return None
+    if os.environ.get("ZKPROV_NO_NATIVE") == "1":
+        return None
+    try:
+        import zkprov_native
+    except ImportError:
+        return None
+    return zkprov_native
+
+
+# C prototypes, built once and shared by every load. The exports are plain
+# `extern "C"` (cdecl on every platform, hence CDLL/CFUNCTYPE rather than
+# WinDLL) and report failures through return codes, never errno. CFUNCTYPE
+# already leaves errno/GetLastError swapping off by default; _NO_ERRNO only
+# states that explicitly so it is not switched on by accident.
+_NO_ERRNO = {"use_errno": False, "use_last_error": False}
 
+# int32_t zkp_bootstrap(char** out_backends, char** out_profiles);
+_BOOTSTRAP_SIG = CFUNCTYPE(c_int, POINTER(c_char_p), POINTER(c_char_p), **_NO_ERRNO)
 
-# C prototypes:
-# int32_t zkp_init(void);
-_LIB.zkp_init.restype = c_int
-_LIB.zkp_init.argtypes = []
+# struct ZkpProveMeta { uint8_t digest[32]; uint64_t proof_len; };
+class _ProveMeta(ctypes.Structure):
+    _fields_ = [("digest", c_uint8 * 32), ("proof_len", c_uint64)]
 
-# int32_t zkp_list_backends(char** out_json);
-_LIB.zkp_list_backends.restype = c_int
-_LIB.zkp_list_backends.argtypes = [POINTER(c_char_p)]
 
-_LIB.zkp_list_profiles.restype = c_int
-_LIB.zkp_list_profiles.argtypes = [POINTER(c_char_p)]
+# struct ZkpVerifyMeta { uint8_t digest[32]; uint8_t verified; };
+class _VerifyMeta(ctypes.Structure):
+    _fields_ = [("digest", c_uint8 * 32), ("verified", c_uint8)]
 
-# int32_t zkp_prove(..., uint8_t** out_proof, uint64_t* out_len, char** out_json_meta);
-_LIB.zkp_prove.restype = c_int
-_LIB.zkp_prove.argtypes = [
+
+# int32_t zkp_prove_into(..., uint8_t** out_proof, uint64_t* out_len,
+#                        ZkpProveMeta* out_meta);
+_PROVE_SIG = CFUNCTYPE(
+    c_int,
     c_char_p,
     c_char_p,
     c_char_p,
@@ -71,12 +180,14 @@ _LIB.zkp_prove.argtypes = [
     c_char_p,
     POINTER(POINTER(c_uint8)),
     POINTER(c_uint64),
-    POINTER(c_char_p),
-]
+    POINTER(_ProveMeta),
+    **_NO_ERRNO,
+)
 
-# int32_t zkp_verify(..., const uint8_t* proof, uint64_t len, char** out_json_meta);
-_LIB.zkp_verify.restype = c_int
-_LIB.zkp_verify.argtypes = [
+# int32_t zkp_verify_into(..., const uint8_t* proof, uint64_t len,
+#                         ZkpVerifyMeta* out_meta);
+_VERIFY_SIG = CFUNCTYPE(
+    c_int,
     c_char_p,
     c_char_p,
     c_char_p,
@@ -84,134 +195,516 @@ _LIB.zkp_verify.argtypes = [
     c_char_p,
     c_char_p,
     c_char_p,
-    POINTER(c_uint8),
+    c_void_p,  # accepts bytes and ctypes arrays without copying
     c_uint64,
-    POINTER(c_char_p),
+    POINTER(_VerifyMeta),
+    **_NO_ERRNO,
+)
+
+# Batch request/response structs (ZkpProveReq etc. in zkprov.h). Pointers are
+# c_void_p so ctypes does not convert them to bytes.
+_CONFIG_FIELDS = [
+    ("backend_id", c_char_p),
+    ("field", c_char_p),
+    ("hash_id", c_char_p),
+    ("fri_arity", c_uint32),
+    ("profile_id", c_char_p),
+    ("air_path", c_char_p),
+    ("public_inputs_json", c_char_p),
 ]
 
+
+class _ProveReq(ctypes.Structure):
+    _fields_ = _CONFIG_FIELDS
+
+
+class _ProveResp(ctypes.Structure):
+    _fields_ = [
+        ("code", c_int),
+        ("proof", c_void_p),  # caller frees
+        ("meta", _ProveMeta),
+    ]
+
+
+class _VerifyReq(ctypes.Structure):
+    _fields_ = _CONFIG_FIELDS + [("proof", c_void_p), ("proof_len", c_uint64)]
+
+
+class _VerifyResp(ctypes.Structure):
+    _fields_ = [("code", c_int), ("meta", _VerifyMeta)]
+
+
+# int32_t zkp_prove_batch(const ZkpProveReq* reqs, uint64_t n, ZkpProveResp* out);
+_PROVE_BATCH_SIG = CFUNCTYPE(
+    c_int, POINTER(_ProveReq), c_uint64, POINTER(_ProveResp), **_NO_ERRNO
+)
+
+# int32_t zkp_verify_batch(const ZkpVerifyReq* reqs, uint64_t n, ZkpVerifyResp* out);
+_VERIFY_BATCH_SIG = CFUNCTYPE(
+    c_int, POINTER(_VerifyReq), c_uint64, POINTER(_VerifyResp), **_NO_ERRNO
+)
+
 # void zkp_free(void*);
-_LIB.zkp_free.restype = None
-_LIB.zkp_free.argtypes = [c_void_p]
+_FREE_SIG = CFUNCTYPE(None, c_void_p, **_NO_ERRNO)
+
+_SIGNATURES = (
+    ("zkp_bootstrap", _BOOTSTRAP_SIG),
+    ("zkp_prove_into", _PROVE_SIG),
+    ("zkp_verify_into", _VERIFY_SIG),
+    ("zkp_prove_batch", _PROVE_BATCH_SIG),
+    ("zkp_verify_batch", _VERIFY_BATCH_SIG),
+    ("zkp_free", _FREE_SIG),
+)
+
+
+class _Lib:
+    """Loaded library with its entry points bound to the prototypes above."""
 
+    __slots__ = ("dll",) + tuple(name for name, _ in _SIGNATURES)
 
-def _decode_json(ptr: c_char_p):
-    s = ""
+    def __init__(self, dll: CDLL):
+        self.dll = dll
+        for name, sig in _SIGNATURES:
+            setattr(self, name, ctypes.cast(getattr(dll, name), sig))
+
+
+def _parse_json(raw: bytes):
     try:
-        if ptr:
-            raw = ctypes.cast(ptr, c_char_p).value
-            s = raw.decode("utf-8") if raw else ""
-            _LIB.zkp_free(ptr)  # free as per API contract
-        return json.loads(s or "{}")
+        return _loads(raw) if raw else {}
     except Exception as e:  # pragma: no cover - defensive guard
-        raise RuntimeError(f"Invalid JSON from native: {e}\n{s!r}")
+        raise RuntimeError(f"Invalid JSON from native: {e}\n{raw!r}")
+
+
+def _decode_json(lib: _Lib, ptr: c_char_p):
+    raw = b""
+    if ptr:
+        raw = ptr.value
+        lib.zkp_free(ptr)  # free as per API contract
+    return _parse_json(raw)
+
+
+# Names of the ZKP_ERR_* codes in zkprov.h.
+_ERROR_NAMES = {
+    1: "InvalidArg",
+    2: "Backend",
+    3: "Profile",
+    4: "ProofCorrupt",
+    5: "VerifyFail",
+    6: "Internal",
+}
+
+
+class ZkpError(RuntimeError):
+    """Error status returned by the prover runtime.
+
+    Raised by both the ctypes bridge and the native extension; ``code`` is the
+    ``ZKP_ERR_*`` value, ``msg`` and ``detail`` come from the error envelope.
+    Calls that return no envelope get the code's name (e.g. ``VerifyFail``)
+    as ``msg``.
+    """
+
+    def __init__(
+        self, code: int, msg: Optional[str] = None, detail: Optional[str] = None
+    ):
+        if msg is None:
+            msg = _ERROR_NAMES.get(code, "Unknown")
+        super().__init__(code, msg, detail)
+        self.code = code
+        self.msg = msg
+        self.detail = detail
+
+    def __str__(self) -> str:
+        return f"[ZKProv err {self.code}] {self.msg}" + (
+            f" ({self.detail})" if self.detail else ""
+        )
 
 
 def _err(code, payload):
     # payload is dict from native JSON envelope (if any)
     msg = payload.get("msg") if isinstance(payload, dict) else str(payload)
     detail = payload.get("detail") if isinstance(payload, dict) else None
-    raise RuntimeError(
-        f"[ZKProv err {code}] {msg}" + (f" ({detail})" if detail else "")
-    )
+    raise ZkpError(code, msg, detail)
 
 
-# one-time init (idempotent)
-_rc = _LIB.zkp_init()
-if _rc != 0:
-    raise RuntimeError(f"zkp_init failed: code={_rc}")
+# Neither the extension nor the ctypes library is loaded at import: the
+# implementation is picked, and loaded, on first use.
+_NATIVE = None
+_IMPL = None
+_LIB: Optional[_Lib] = None
+_LIB_LOCK = threading.Lock()
 
+# (backends, profiles), fetched by one zkp_bootstrap call and shared,
+# read-only, by every list_* call until reset().
+_LISTINGS: Optional[tuple] = None
 
-def list_backends() -> dict:
-    out = c_char_p()
-    code = _LIB.zkp_list_backends(ctypes.byref(out))
-    payload = _decode_json(out)
-    if code != 0:
-        _err(code, payload)
-    return payload
 
+def _freeze(value):
+    """Read-only form of a decoded JSON value (dicts as views, lists as tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _fetch_listings(lib: _Lib) -> tuple:
+    backends, profiles = c_char_p(), c_char_p()
+    rc = lib.zkp_bootstrap(ctypes.byref(backends), ctypes.byref(profiles))
+    backends = _decode_json(lib, backends)
+    profiles = _decode_json(lib, profiles)
+    if rc != 0:
+        raise ZkpError(rc, "zkp_bootstrap failed")
+    return _freeze(backends), _freeze(profiles)
+
+
+def _get_lib() -> _Lib:
+    """Return the loaded library, loading it on first call.
+
+    No init call is made here: every entry point initialises the runtime
+    itself on first use.
+    """
+
+    global _LIB
+    lib = _LIB
+    if lib is None:
+        with _LIB_LOCK:
+            if _LIB is None:
+                _LIB = _Lib(_load_lib())
+            lib = _LIB
+    return lib
+
+
+def _ctypes_listings() -> tuple:
+    global _LISTINGS
+    lib = _get_lib()
+    listings = _LISTINGS
+    if listings is None:
+        listings = _LISTINGS = _fetch_listings(lib)
+    return listings
+
+
+def _native_listings() -> tuple:
+    global _LISTINGS
+    listings = _LISTINGS
+    if listings is None:
+        backends, profiles = _NATIVE.bootstrap()
+        listings = _LISTINGS = (_freeze(backends), _freeze(profiles))
+    return listings
+
+
+def list_backends():
+    """Registered backends, as a read-only view shared between calls."""
+    return _impl().listings()[0]
 
-def list_profiles() -> dict:
-    out = c_char_p()
-    code = _LIB.zkp_list_profiles(ctypes.byref(out))
-    payload = _decode_json(out)
-    if code != 0:
-        _err(code, payload)
-    return payload
+
+def list_profiles():
+    """Available profiles, as a read-only view shared between calls."""
+    return _impl().listings()[1]
+
+
+def reset() -> None:
+    """Forget the cached listings; the next ``list_*`` call fetches them again."""
+    global _LISTINGS
+    _LISTINGS = None
+
+
+# Only for the small, frequently repeated identifiers (backend, field, hash,
+# profile, AIR path); per-statement public inputs are encoded uncached.
+@functools.lru_cache(maxsize=256)
+def _encode(value: str) -> bytes:
+    return value.encode()
+
+
+@dataclass(frozen=True)
+class ProveConfig:
+    """Prover configuration shared by :func:`prove` and :func:`verify`.
+
+    The string fields are UTF-8 encoded once, at construction, so a config
+    reused across calls (e.g. a prove/verify pair) is not re-encoded per call.
+    """
+
+    backend_id: str
+    field: str
+    hash_id: str
+    fri_arity: int
+    profile_id: str
+    air_path: str
+    public_inputs_json: str
+    _c_args: tuple = _dataclass_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_c_args",
+            (
+                _encode(self.backend_id),
+                _encode(self.field),
+                _encode(self.hash_id),
+                c_uint32(self.fri_arity),
+                _encode(self.profile_id),
+                _encode(self.air_path),
+                self.public_inputs_json.encode(),
+            ),
+        )
+
+    @property
+    def _req_args(self) -> tuple:
+        # struct fields take a plain int where the call arguments use c_uint32
+        return (*self._c_args[:3], self.fri_arity, *self._c_args[4:])
+
+    @property
+    def _py_args(self) -> tuple:
+        return (
+            self.backend_id,
+            self.field,
+            self.hash_id,
+            self.fri_arity,
+            self.profile_id,
+            self.air_path,
+            self.public_inputs_json,
+        )
+
+
+class ProveMeta(NamedTuple):
+    """Metadata returned by :func:`prove`."""
+
+    digest: str
+    proof_len: int
+
+
+class VerifyMeta(NamedTuple):
+    """Metadata returned by :func:`verify`."""
+
+    digest: str
+    verified: bool
+
+
+def _resolve_config(config: Optional[ProveConfig], kwargs: dict) -> ProveConfig:
+    if config is None:
+        return ProveConfig(**kwargs)
+    if kwargs:
+        raise TypeError("pass either a ProveConfig or keyword arguments, not both")
+    return config
+
+
+def _as_config(config) -> ProveConfig:
+    return config if isinstance(config, ProveConfig) else ProveConfig(**config)
+
+
+def _proof_view(lib: _Lib, ptr, n: int) -> memoryview:
+    """Expose a runtime-owned proof buffer, read-only and without copying it.
+
+    The memory is handed back to ``zkp_free`` once the last view over it is
+    garbage collected.
+    """
+    if not ptr:
+        return memoryview(b"")
+    buf = ctypes.cast(ptr, POINTER(c_uint8 * n)).contents
+    weakref.finalize(buf, lib.zkp_free, ptr)
+    return memoryview(buf).cast("B").toreadonly()
+
+
+def _proof_arg(proof):
+    """Return a ``const uint8_t*`` argument for ``proof`` and its length."""
+    if isinstance(proof, bytes):
+        # passed as the bytes object's own storage, no copy
+        return proof, len(proof)
+    view = memoryview(proof)
+    n = view.nbytes
+    if isinstance(view.obj, ctypes.Array) and n == ctypes.sizeof(view.obj):
+        # a view from prove(): pass the runtime's buffer itself
+        return ctypes.addressof(view.obj), n
+    try:
+        # other writable buffers are passed in place too
+        return (c_uint8 * n).from_buffer(view), n
+    except TypeError:
+        return (c_uint8 * n).from_buffer_copy(view), n
 
 
-class ProveConfig(ctypes.Structure):
-    # plain Python object is fine; this is informational only
-    pass
+def _digest_hex(digest) -> str:
+    # same spelling as the JSON envelopes' "digest"
+    return "0x" + bytes(digest).hex()
 
 
-def prove(
-    *,
-    backend_id: str,
-    field: str,
-    hash_id: str,
-    fri_arity: int,
-    profile_id: str,
-    air_path: str,
-    public_inputs_json: str,
-):
+def _ctypes_prove(cfg: ProveConfig):
+    lib = _get_lib()
     out_proof = POINTER(c_uint8)()
     out_len = c_uint64(0)
-    out_meta = c_char_p()
-
-    code = _LIB.zkp_prove(
-        backend_id.encode(),
-        field.encode(),
-        hash_id.encode(),
-        c_uint32(fri_arity),
-        profile_id.encode(),
-        air_path.encode(),
-        public_inputs_json.encode(),
-        ctypes.byref(out_proof),
-        ctypes.byref(out_len),
-        ctypes.byref(out_meta),
+    meta = _ProveMeta()
+    code = lib.zkp_prove_into(
+        *cfg._c_args, ctypes.byref(out_proof), ctypes.byref(out_len), ctypes.byref(meta)
     )
-    meta = _decode_json(out_meta)
     if code != 0:
         # if native allocated a proof buffer on error, free it
         if out_proof:
-            _LIB.zkp_free(out_proof)
-        _err(code, meta)
+            lib.zkp_free(out_proof)
+        _err(code, {})
 
-    n = int(out_len.value)
-    try:
-        proof = ctypes.string_at(out_proof, n)  # copy into bytes
-    finally:
-        if out_proof:
-            _LIB.zkp_free(out_proof)
-    return proof, meta
-
-
-def verify(
-    *,
-    backend_id: str,
-    field: str,
-    hash_id: str,
-    fri_arity: int,
-    profile_id: str,
-    air_path: str,
-    public_inputs_json: str,
-    proof: bytes,
-):
-    buf = (c_uint8 * len(proof)).from_buffer_copy(proof)
-    out_meta = c_char_p()
-    code = _LIB.zkp_verify(
-        backend_id.encode(),
-        field.encode(),
-        hash_id.encode(),
-        c_uint32(fri_arity),
-        profile_id.encode(),
-        air_path.encode(),
-        public_inputs_json.encode(),
-        ctypes.cast(buf, POINTER(c_uint8)),
-        c_uint64(len(proof)),
-        ctypes.byref(out_meta),
+    return (
+        _proof_view(lib, out_proof, int(out_len.value)),
+        ProveMeta(_digest_hex(meta.digest), meta.proof_len),
     )
-    meta = _decode_json(out_meta)
+
+
+def _ctypes_verify(cfg: ProveConfig, proof):
+    lib = _get_lib()
+    buf, n = _proof_arg(proof)
+    meta = _VerifyMeta()
+    code = lib.zkp_verify_into(*cfg._c_args, buf, c_uint64(n), ctypes.byref(meta))
     if code != 0:
-        _err(code, meta)
-    return bool(meta.get("verified", False)), meta
+        _err(code, {})
+    verified = bool(meta.verified)
+    return verified, VerifyMeta(_digest_hex(meta.digest), verified)
+
+
+def _ctypes_prove_many(cfgs):
+    lib = _get_lib()
+    n = len(cfgs)
+    reqs = (_ProveReq * n)(*(_ProveReq(*cfg._req_args) for cfg in cfgs))
+    resps = (_ProveResp * n)()
+    code = lib.zkp_prove_batch(reqs, n, resps)
+    if code != 0:
+        _err(code, {})
+
+    results, error = [], None
+    for resp in resps:
+        meta = resp.meta
+        # wrapped even on failure so every buffer is released
+        proof = _proof_view(lib, resp.proof, int(meta.proof_len))
+        if resp.code != 0:
+            error = error or resp.code
+            continue
+        results.append((proof, ProveMeta(_digest_hex(meta.digest), meta.proof_len)))
+    if error is not None:
+        _err(error, {})
+    return results
+
+
+def _ctypes_verify_many(items):
+    lib = _get_lib()
+    n = len(items)
+    args = [_proof_arg(proof) for _, proof in items]  # kept alive for the call
+    reqs = (_VerifyReq * n)(
+        *(
+            _VerifyReq(*cfg._req_args, ctypes.cast(buf, c_void_p), size)
+            for (cfg, _), (buf, size) in zip(items, args)
+        )
+    )
+    resps = (_VerifyResp * n)()
+    code = lib.zkp_verify_batch(reqs, n, resps)
+    if code != 0:
+        _err(code, {})
+
+    results = []
+    for resp in resps:
+        if resp.code != 0:
+            _err(resp.code, {})
+        verified = bool(resp.meta.verified)
+        results.append((verified, VerifyMeta(_digest_hex(resp.meta.digest), verified)))
+    return results
+
+
+def _native_prove(cfg: ProveConfig):
+    proof, meta = _NATIVE.prove(*cfg._py_args)
+    return proof, ProveMeta(*meta)
+
+
+def _native_verify(cfg: ProveConfig, proof):
+    if not isinstance(proof, bytes):
+        proof = bytes(proof)  # the extension takes a &[u8], i.e. bytes only
+    verified, meta = _NATIVE.verify(*cfg._py_args, proof)
+    return verified, VerifyMeta(*meta)
+
+
+def prove(config: Optional[ProveConfig] = None, /, **kwargs):
+    """Generate a proof; returns ``(proof, meta)`` with ``meta`` a :class:`ProveMeta`.
+
+    Pass a :class:`ProveConfig`, or the same fields as keyword arguments
+    (``backend_id``, ``field``, ``hash_id``, ``fri_arity``, ``profile_id``,
+    ``air_path``, ``public_inputs_json``).
+
+    ``proof`` is a bytes-like object: on the ctypes path it is a read-only
+    ``memoryview`` over the runtime's buffer (no copy), which can be passed
+    straight back to :func:`verify`; the native extension returns ``bytes``.
+    Use ``bytes(proof)`` for an owned copy (e.g. to hash or pickle it).
+    """
+    return _impl().prove(_resolve_config(config, kwargs))
+
+
+def verify(config: Optional[ProveConfig] = None, /, *, proof, **kwargs):
+    """Verify ``proof`` (any bytes-like object); returns ``(verified, meta)``
+    with ``meta`` a :class:`VerifyMeta`.
+
+    The configuration is given as in :func:`prove`.
+    """
+    return _impl().verify(_resolve_config(config, kwargs), proof)
+
+
+def _native_prove_many(cfgs):
+    # an extension call costs little next to ctypes, so no batch entry point
+    return [_native_prove(cfg) for cfg in cfgs]
+
+
+def _native_verify_many(items):
+    return [_native_verify(cfg, proof) for cfg, proof in items]
+
+
+def prove_many(configs):
+    """Generate one proof per configuration.
+
+    The ctypes bridge makes a single ``zkp_prove_batch`` call for the lot.
+    ``configs`` holds :class:`ProveConfig` instances or dicts of its fields.
+    Returns a list of ``(proof, meta)`` pairs as from :func:`prove`; if any
+    configuration fails, :class:`ZkpError` is raised for the first one.
+    """
+    cfgs = [_as_config(config) for config in configs]
+    return _impl().prove_many(cfgs) if cfgs else []
+
+
+def verify_many(items):
+    """Verify several ``(config, proof)`` pairs (one ``zkp_verify_batch`` call).
+
+    Returns a list of ``(verified, meta)`` pairs as from :func:`verify`.
+    """
+    pairs = [(_as_config(config), proof) for config, proof in items]
+    return _impl().verify_many(pairs) if pairs else []
+
+
+class _Impl(NamedTuple):
+    listings: Callable
+    prove: Callable
+    verify: Callable
+    prove_many: Callable
+    verify_many: Callable
+
+
+# Both paths return the same ProveMeta/VerifyMeta types; proofs differ (a
+# read-only memoryview from ctypes, bytes from the extension).
+_NATIVE_IMPL = _Impl(
+    _native_listings,
+    _native_prove,
+    _native_verify,
+    _native_prove_many,
+    _native_verify_many,
+)
+_CTYPES_IMPL = _Impl(
+    _ctypes_listings,
+    _ctypes_prove,
+    _ctypes_verify,
+    _ctypes_prove_many,
+    _ctypes_verify_many,
+)
+
+
+def _impl() -> _Impl:
+    """Return the native or ctypes implementation, choosing it on first call."""
+
+    global _NATIVE, _IMPL
+    impl = _IMPL
+    if impl is None:
+        with _LIB_LOCK:
+            if _IMPL is None:
+                _NATIVE = _load_native()
+                _IMPL = _CTYPES_IMPL if _NATIVE is None else _NATIVE_IMPL
+            impl = _IMPL
+    return impl
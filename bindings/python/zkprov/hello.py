@@ -1,13 +1,13 @@
 import json
 import sys
 
-from . import list_backends, prove, verify
+from . import ProveConfig, list_backends, prove, verify
 
 
 def main(argv=None):
     backs = list_backends()
-    print("backends:", list(backs.keys()))
-    cfg = dict(
+    print("backends:", [backend["id"] for backend in backs])
+    cfg = ProveConfig(
         backend_id="native@0.0",
         field="Prime254",
         hash_id="blake3",
@@ -16,10 +16,10 @@ def main(argv=None):
         air_path="examples/air/toy.air",
         public_inputs_json='{"demo":true,"n":7}',
     )
-    proof, meta = prove(**cfg)
-    print("D=", meta.get("digest"), "len=", meta.get("proof_len"))
-    ok, meta2 = verify(proof=proof, **cfg)
-    print("verified:", ok, "D2=", meta2.get("digest"))
+    proof, meta = prove(cfg)
+    print("D=", meta.digest, "len=", meta.proof_len)
+    ok, meta2 = verify(cfg, proof=proof)
+    print("verified:", ok, "D2=", meta2.digest)
     sys.exit(0 if ok else 1)
 
 
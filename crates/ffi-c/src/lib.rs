@@ -244,11 +244,57 @@ fn with_version(envelope: Envelope) -> Envelope {
     }
 }
 
+fn backends_json() -> FfiResult<String> {
+    let infos: Vec<BackendInfo> = registry::list_backend_infos();
+    serialize_json(&infos)
+}
+
+fn profiles_json() -> FfiResult<String> {
+    let profiles = load_all_profiles().map_err(|_| ErrorCode::Internal)?;
+    serialize_json(&profiles)
+}
+
 #[no_mangle]
 pub extern "C" fn zkp_init() -> i32 {
     to_i32(init_runtime())
 }
 
+/// Initialise the runtime and return the backend and profile listings in one
+/// call.
+///
+/// # Safety
+///
+/// - `out_backends` and `out_profiles` must point to valid, writable memory
+///   where pointers to newly allocated, null-terminated strings can be stored.
+/// - The caller is responsible for freeing both returned strings with
+///   [`zkp_free`].
+#[no_mangle]
+pub unsafe extern "C" fn zkp_bootstrap(
+    out_backends: *mut *mut c_char,
+    out_profiles: *mut *mut c_char,
+) -> i32 {
+    to_i32((|| {
+        ensure_output_ptr(out_backends)?;
+        ensure_output_ptr(out_profiles)?;
+        init_runtime()?;
+        let backends = backends_json()?;
+        let profiles = profiles_json()?;
+        let backends_ptr = alloc_cstring(&backends)?;
+        let profiles_ptr = match alloc_cstring(&profiles) {
+            Ok(ptr) => ptr,
+            Err(err) => {
+                release_allocation(backends_ptr.cast());
+                return Err(err);
+            }
+        };
+        unsafe {
+            *out_backends = backends_ptr;
+            *out_profiles = profiles_ptr;
+        }
+        Ok(())
+    })())
+}
+
 /// # Safety
 ///
 /// - `out_json` must point to valid, writable memory where a pointer to a newly
@@ -260,9 +306,7 @@ pub unsafe extern "C" fn zkp_list_backends(out_json: *mut *mut c_char) -> i32 {
     to_i32((|| {
         ensure_output_ptr(out_json)?;
         init_runtime()?;
-        let infos: Vec<BackendInfo> = registry::list_backend_infos();
-        let json = serialize_json(&infos)?;
-        let ptr = alloc_cstring(&json)?;
+        let ptr = alloc_cstring(&backends_json()?)?;
         unsafe {
             *out_json = ptr;
         }
@@ -281,9 +325,7 @@ pub unsafe extern "C" fn zkp_list_profiles(out_json: *mut *mut c_char) -> i32 {
     to_i32((|| {
         ensure_output_ptr(out_json)?;
         init_runtime()?;
-        let profiles = load_all_profiles().map_err(|_| ErrorCode::Internal)?;
-        let json = serialize_json(&profiles)?;
-        let ptr = alloc_cstring(&json)?;
+        let ptr = alloc_cstring(&profiles_json()?)?;
         unsafe {
             *out_json = ptr;
         }
@@ -311,6 +353,144 @@ pub unsafe extern "C" fn zkp_version(out_json: *mut *mut c_char) -> i32 {
     })())
 }
 
+/// Proof bytes and digest produced by a successful prove call.
+struct ProveOutput {
+    proof: Vec<u8>,
+    digest: [u8; 32],
+}
+
+impl ProveOutput {
+    fn proof_len(&self) -> FfiResult<u64> {
+        u64::try_from(self.proof.len()).map_err(|_| ErrorCode::Internal)
+    }
+
+    /// JSON metadata envelope returned by [`zkp_prove`].
+    fn meta_json(&self) -> FfiResult<String> {
+        let meta_envelope = with_version(with_field(
+            with_field(ok(), "digest", hex_encode(&self.digest)),
+            "proof_len",
+            self.proof_len()?,
+        ));
+        Ok(meta_envelope.into_string())
+    }
+}
+
+/// JSON metadata envelope returned by [`zkp_verify`].
+fn verify_meta_json(digest: &[u8; 32]) -> String {
+    with_version(with_field(
+        with_field(ok(), "verified", true),
+        "digest",
+        hex_encode(digest),
+    ))
+    .into_string()
+}
+
+/// # Safety
+///
+/// All pointer arguments must be valid for reads of a null-terminated string.
+unsafe fn prove_impl(
+    backend_id: *const c_char,
+    field: *const c_char,
+    hash_id: *const c_char,
+    fri_arity: u32,
+    profile_id: *const c_char,
+    air_path: *const c_char,
+    public_inputs_json: *const c_char,
+) -> FfiResult<ProveOutput> {
+    init_runtime()?;
+
+    let backend = read_cstring(backend_id)?;
+    let field = read_cstring(field)?;
+    let hash = read_cstring(hash_id)?;
+    let profile = read_cstring(profile_id)?;
+    let air = read_cstring(air_path)?;
+    let pub_inputs = read_cstring(public_inputs_json)?;
+
+    let config = Config::new(backend, field, hash, fri_arity, false, profile);
+    validate_config(&config).map_err(|e| map_capability_error(&e))?;
+
+    let proof = native_prove(&config, &pub_inputs, &air).map_err(|e| map_prove_error(&e))?;
+    if proof.len() < 40 {
+        return Err(ErrorCode::Internal);
+    }
+    let header = ProofHeader::decode(&proof[0..40]).map_err(|_| ErrorCode::Internal)?;
+    let digest = digest_D(&header, &proof[40..]);
+    Ok(ProveOutput { proof, digest })
+}
+
+/// # Safety
+///
+/// All string pointers must be valid for reads of a null-terminated string.
+/// When `proof_len` is non-zero, `proof_ptr` must reference at least
+/// `proof_len` readable bytes.
+#[allow(clippy::too_many_arguments)]
+unsafe fn verify_impl(
+    backend_id: *const c_char,
+    field: *const c_char,
+    hash_id: *const c_char,
+    fri_arity: u32,
+    profile_id: *const c_char,
+    air_path: *const c_char,
+    public_inputs_json: *const c_char,
+    proof_ptr: *const u8,
+    proof_len: u64,
+) -> FfiResult<[u8; 32]> {
+    init_runtime()?;
+
+    let backend = read_cstring(backend_id)?;
+    let field = read_cstring(field)?;
+    let hash = read_cstring(hash_id)?;
+    let profile = read_cstring(profile_id)?;
+    let air = read_cstring(air_path)?;
+    let pub_inputs = read_cstring(public_inputs_json)?;
+
+    let proof_len_usize = usize::try_from(proof_len).map_err(|_| ErrorCode::InvalidArg)?;
+    if proof_len_usize == 0 {
+        return Err(ErrorCode::ProofCorrupt);
+    }
+    if proof_ptr.is_null() {
+        return Err(ErrorCode::InvalidArg);
+    }
+    let proof = unsafe { slice::from_raw_parts(proof_ptr, proof_len_usize) };
+
+    if proof.len() < 40 {
+        return Err(ErrorCode::ProofCorrupt);
+    }
+    let header = ProofHeader::decode(&proof[0..40]).map_err(|_| ErrorCode::ProofCorrupt)?;
+    let body = &proof[40..];
+    if u64::try_from(body.len()).map_err(|_| ErrorCode::Internal)? != header.body_len {
+        return Err(ErrorCode::ProofCorrupt);
+    }
+    let digest = digest_D(&header, body);
+
+    let config = Config::new(backend, field, hash, fri_arity, false, profile);
+    validate_config(&config).map_err(|e| map_capability_error(&e))?;
+
+    match native_verify(&config, &pub_inputs, &air, proof) {
+        Ok(true) => {}
+        Ok(false) => return Err(ErrorCode::VerifyFail),
+        Err(err) => return Err(map_verify_error(&err)),
+    }
+
+    Ok(digest)
+}
+
+/// Fixed-layout metadata written by [`zkp_prove_into`].
+#[repr(C)]
+#[derive(Debug, Default, Clone, Copy, PartialEq, Eq)]
+pub struct ZkpProveMeta {
+    pub digest: [u8; 32],
+    pub proof_len: u64,
+}
+
+/// Fixed-layout metadata written by [`zkp_verify_into`].
+#[repr(C)]
+#[derive(Debug, Default, Clone, Copy, PartialEq, Eq)]
+pub struct ZkpVerifyMeta {
+    pub digest: [u8; 32],
+    pub verified: u8,
+}
+
 /// # Safety
 ///
 /// - All pointer arguments must be valid for reads of a null-terminated string
@@ -338,38 +518,22 @@ pub unsafe extern "C" fn zkp_prove(
         ensure_output_ptr(out_proof)?;
         ensure_output_scalar(out_proof_len)?;
         ensure_output_ptr(out_json_meta)?;
-        init_runtime()?;
 
-        let backend = read_cstring(backend_id)?;
-        let field = read_cstring(field)?;
-        let hash = read_cstring(hash_id)?;
-        let profile = read_cstring(profile_id)?;
-        let air = read_cstring(air_path)?;
-        let pub_inputs = read_cstring(public_inputs_json)?;
-
-        let config = Config::new(backend, field, hash, fri_arity, false, profile);
-        validate_config(&config).map_err(|e| map_capability_error(&e))?;
-
-        let proof = native_prove(&config, &pub_inputs, &air).map_err(|e| map_prove_error(&e))?;
-        let proof_len = proof.len();
-        let proof_len_u64 = u64::try_from(proof_len).map_err(|_| ErrorCode::Internal)?;
-        if proof_len < 40 {
-            return Err(ErrorCode::Internal);
-        }
-        let header = ProofHeader::decode(&proof[0..40]).map_err(|_| ErrorCode::Internal)?;
-        let body = &proof[40..];
-        let digest = digest_D(&header, body);
-        let digest_hex = hex_encode(&digest);
-
-        let meta_envelope = with_version(with_field(
-            with_field(ok(), "digest", digest_hex),
-            "proof_len",
-            proof_len_u64,
-        ));
-        let meta_json = meta_envelope.into_string();
-        let meta_ptr = alloc_cstring(&meta_json)?;
+        let output = unsafe {
+            prove_impl(
+                backend_id,
+                field,
+                hash_id,
+                fri_arity,
+                profile_id,
+                air_path,
+                public_inputs_json,
+            )
+        }?;
+        let proof_len_u64 = output.proof_len()?;
+        let meta_ptr = alloc_cstring(&output.meta_json()?)?;
 
-        let proof_ptr = leak_vec(proof).inspect_err(|_| {
+        let proof_ptr = leak_vec(output.proof).inspect_err(|_| {
             release_allocation(meta_ptr as *mut u8);
         })?;
 
@@ -382,6 +546,58 @@ pub unsafe extern "C" fn zkp_prove(
     })())
 }
 
+/// Variant of [`zkp_prove`] that reports metadata through a caller-owned
+/// [`ZkpProveMeta`] instead of an allocated JSON envelope.
+///
+/// # Safety
+///
+/// - String and proof output arguments follow [`zkp_prove`].
+/// - `out_meta` must be a valid, writable pointer; it is zeroed on failure.
+#[allow(clippy::too_many_arguments)]
+#[no_mangle]
+pub unsafe extern "C" fn zkp_prove_into(
+    backend_id: *const c_char,
+    field: *const c_char,
+    hash_id: *const c_char,
+    fri_arity: u32,
+    profile_id: *const c_char,
+    air_path: *const c_char,
+    public_inputs_json: *const c_char,
+    out_proof: *mut *mut u8,
+    out_proof_len: *mut u64,
+    out_meta: *mut ZkpProveMeta,
+) -> i32 {
+    to_i32((|| {
+        ensure_output_ptr(out_proof)?;
+        ensure_output_scalar(out_proof_len)?;
+        ensure_output_scalar(out_meta)?;
+
+        let output = unsafe {
+            prove_impl(
+                backend_id,
+                field,
+                hash_id,
+                fri_arity,
+                profile_id,
+                air_path,
+                public_inputs_json,
+            )
+        }?;
+        let meta = ZkpProveMeta {
+            digest: output.digest,
+            proof_len: output.proof_len()?,
+        };
+        let proof_ptr = leak_vec(output.proof)?;
+
+        unsafe {
+            *out_proof = proof_ptr;
+            *out_proof_len = meta.proof_len;
+            *out_meta = meta;
+        }
+        Ok(())
+    })())
+}
+
 /// # Safety
 ///
 /// - All pointer arguments must be valid for reads of a null-terminated string
@@ -407,53 +623,251 @@ pub unsafe extern "C" fn zkp_verify(
 ) -> i32 {
     to_i32((|| {
         ensure_output_ptr(out_json_meta)?;
-        init_runtime()?;
 
-        let backend = read_cstring(backend_id)?;
-        let field = read_cstring(field)?;
-        let hash = read_cstring(hash_id)?;
-        let profile = read_cstring(profile_id)?;
-        let air = read_cstring(air_path)?;
-        let pub_inputs = read_cstring(public_inputs_json)?;
-
-        let proof_len_usize = usize::try_from(proof_len).map_err(|_| ErrorCode::InvalidArg)?;
-        if proof_len_usize == 0 {
-            return Err(ErrorCode::ProofCorrupt);
-        }
-        if proof_ptr.is_null() {
-            return Err(ErrorCode::InvalidArg);
+        let digest = unsafe {
+            verify_impl(
+                backend_id,
+                field,
+                hash_id,
+                fri_arity,
+                profile_id,
+                air_path,
+                public_inputs_json,
+                proof_ptr,
+                proof_len,
+            )
+        }?;
+        let meta_ptr = alloc_cstring(&verify_meta_json(&digest))?;
+        unsafe {
+            *out_json_meta = meta_ptr;
         }
-        let proof = unsafe { slice::from_raw_parts(proof_ptr, proof_len_usize) };
+        Ok(())
+    })())
+}
 
-        if proof.len() < 40 {
-            return Err(ErrorCode::ProofCorrupt);
+/// Variant of [`zkp_verify`] that reports metadata through a caller-owned
+/// [`ZkpVerifyMeta`] instead of an allocated JSON envelope.
+///
+/// # Safety
+///
+/// - String and proof arguments follow [`zkp_verify`].
+/// - `out_meta` must be a valid, writable pointer; it is zeroed on failure.
+#[allow(clippy::too_many_arguments)]
+#[no_mangle]
+pub unsafe extern "C" fn zkp_verify_into(
+    backend_id: *const c_char,
+    field: *const c_char,
+    hash_id: *const c_char,
+    fri_arity: u32,
+    profile_id: *const c_char,
+    air_path: *const c_char,
+    public_inputs_json: *const c_char,
+    proof_ptr: *const u8,
+    proof_len: u64,
+    out_meta: *mut ZkpVerifyMeta,
+) -> i32 {
+    to_i32((|| {
+        ensure_output_scalar(out_meta)?;
+
+        let digest = unsafe {
+            verify_impl(
+                backend_id,
+                field,
+                hash_id,
+                fri_arity,
+                profile_id,
+                air_path,
+                public_inputs_json,
+                proof_ptr,
+                proof_len,
+            )
+        }?;
+        unsafe {
+            *out_meta = ZkpVerifyMeta {
+                digest,
+                verified: 1,
+            };
         }
-        let header = ProofHeader::decode(&proof[0..40]).map_err(|_| ErrorCode::ProofCorrupt)?;
-        let body = &proof[40..];
-        if u64::try_from(body.len()).map_err(|_| ErrorCode::Internal)? != header.body_len {
-            return Err(ErrorCode::ProofCorrupt);
+        Ok(())
+    })())
+}
+
+/// One request of a [`zkp_prove_batch`] call; the fields mirror the
+/// arguments of [`zkp_prove`].
+#[repr(C)]
+pub struct ZkpProveReq {
+    pub backend_id: *const c_char,
+    pub field: *const c_char,
+    pub hash_id: *const c_char,
+    pub fri_arity: u32,
+    pub profile_id: *const c_char,
+    pub air_path: *const c_char,
+    pub public_inputs_json: *const c_char,
+}
+
+/// Outcome of one [`ZkpProveReq`]. On success the caller owns `proof`
+/// (`meta.proof_len` bytes) and releases it with [`zkp_free`]; on failure
+/// `proof` is NULL and `meta` is zeroed.
+#[repr(C)]
+pub struct ZkpProveResp {
+    pub code: i32,
+    pub proof: *mut u8,
+    pub meta: ZkpProveMeta,
+}
+
+impl ZkpProveResp {
+    fn failed(code: ErrorCode) -> Self {
+        Self {
+            code: code.code(),
+            proof: ptr::null_mut(),
+            meta: ZkpProveMeta::default(),
         }
-        let digest = digest_D(&header, body);
-        let digest_hex = hex_encode(&digest);
+    }
+}
 
-        let config = Config::new(backend, field, hash, fri_arity, false, profile);
-        validate_config(&config).map_err(|e| map_capability_error(&e))?;
+/// One request of a [`zkp_verify_batch`] call; the fields mirror the
+/// arguments of [`zkp_verify`].
+#[repr(C)]
+pub struct ZkpVerifyReq {
+    pub backend_id: *const c_char,
+    pub field: *const c_char,
+    pub hash_id: *const c_char,
+    pub fri_arity: u32,
+    pub profile_id: *const c_char,
+    pub air_path: *const c_char,
+    pub public_inputs_json: *const c_char,
+    pub proof: *const u8,
+    pub proof_len: u64,
+}
 
-        match native_verify(&config, &pub_inputs, &air, proof) {
-            Ok(true) => {}
-            Ok(false) => return Err(ErrorCode::VerifyFail),
-            Err(err) => return Err(map_verify_error(&err)),
+/// Outcome of one [`ZkpVerifyReq`]; `meta` is zeroed on failure. Nothing in
+/// it needs to be freed.
+#[repr(C)]
+pub struct ZkpVerifyResp {
+    pub code: i32,
+    pub meta: ZkpVerifyMeta,
+}
+
+/// Validate the arrays of a batch call and return the request slice.
+///
+/// # Safety
+///
+/// When `n` is non-zero, `reqs` must reference `n` readable requests.
+unsafe fn batch_requests<'a, Req, Resp>(
+    reqs: *const Req,
+    n: u64,
+    out: *mut Resp,
+) -> FfiResult<&'a [Req]> {
+    let n = usize::try_from(n).map_err(|_| ErrorCode::InvalidArg)?;
+    if n == 0 {
+        return Ok(&[]);
+    }
+    if reqs.is_null() || out.is_null() {
+        return Err(ErrorCode::InvalidArg);
+    }
+    Ok(unsafe { slice::from_raw_parts(reqs, n) })
+}
+
+/// # Safety
+///
+/// The string fields of `req` must satisfy the requirements of [`zkp_prove`].
+unsafe fn prove_one(req: &ZkpProveReq) -> FfiResult<ZkpProveResp> {
+    let output = unsafe {
+        prove_impl(
+            req.backend_id,
+            req.field,
+            req.hash_id,
+            req.fri_arity,
+            req.profile_id,
+            req.air_path,
+            req.public_inputs_json,
+        )
+    }?;
+    let meta = ZkpProveMeta {
+        digest: output.digest,
+        proof_len: output.proof_len()?,
+    };
+    Ok(ZkpProveResp {
+        code: ZKP_OK,
+        proof: leak_vec(output.proof)?,
+        meta,
+    })
+}
+
+/// Run [`zkp_prove`] for each of `n` requests in one call.
+///
+/// The return value only reports invalid arguments; the status of every
+/// request is stored in the `code` of its response, so one failing request
+/// does not abort the others.
+///
+/// # Safety
+///
+/// - When `n` is non-zero, `reqs` must reference `n` readable requests whose
+///   fields satisfy the requirements of [`zkp_prove`], and `out` must be valid
+///   for writes of `n` responses.
+/// - The caller owns every non-NULL `proof` written to `out` and must release
+///   it with [`zkp_free`].
+#[no_mangle]
+pub unsafe extern "C" fn zkp_prove_batch(
+    reqs: *const ZkpProveReq,
+    n: u64,
+    out: *mut ZkpProveResp,
+) -> i32 {
+    to_i32((|| {
+        let reqs = unsafe { batch_requests(reqs, n, out) }?;
+        for (i, req) in reqs.iter().enumerate() {
+            let resp = unsafe { prove_one(req) }.unwrap_or_else(ZkpProveResp::failed);
+            unsafe { out.add(i).write(resp) };
         }
+        Ok(())
+    })())
+}
 
-        let meta_envelope = with_version(with_field(
-            with_field(ok(), "verified", true),
-            "digest",
-            digest_hex,
-        ));
-        let meta_json = meta_envelope.into_string();
-        let meta_ptr = alloc_cstring(&meta_json)?;
-        unsafe {
-            *out_json_meta = meta_ptr;
+/// Run [`zkp_verify`] for each of `n` requests in one call.
+///
+/// As with [`zkp_prove_batch`], per-request status is stored in the `code` of
+/// each response and the return value only reports invalid arguments.
+///
+/// # Safety
+///
+/// - When `n` is non-zero, `reqs` must reference `n` readable requests whose
+///   fields satisfy the requirements of [`zkp_verify`], and `out` must be
+///   valid for writes of `n` responses.
+#[no_mangle]
+pub unsafe extern "C" fn zkp_verify_batch(
+    reqs: *const ZkpVerifyReq,
+    n: u64,
+    out: *mut ZkpVerifyResp,
+) -> i32 {
+    to_i32((|| {
+        let reqs = unsafe { batch_requests(reqs, n, out) }?;
+        for (i, req) in reqs.iter().enumerate() {
+            let resp = match unsafe {
+                verify_impl(
+                    req.backend_id,
+                    req.field,
+                    req.hash_id,
+                    req.fri_arity,
+                    req.profile_id,
+                    req.air_path,
+                    req.public_inputs_json,
+                    req.proof,
+                    req.proof_len,
+                )
+            } {
+                Ok(digest) => ZkpVerifyResp {
+                    code: ZKP_OK,
+                    meta: ZkpVerifyMeta {
+                        digest,
+                        verified: 1,
+                    },
+                },
+                Err(code) => ZkpVerifyResp {
+                    code: code.code(),
+                    meta: ZkpVerifyMeta::default(),
+                },
+            };
+            unsafe { out.add(i).write(resp) };
         }
         Ok(())
     })())
@@ -654,6 +1068,180 @@ mod tests {
         zkp_free(proof_ptr.cast());
     }
 
+    #[test]
+    fn prove_and_verify_into_fill_meta_structs() {
+        let backend = CString::new("native@0.0").unwrap();
+        let field = CString::new("Prime254").unwrap();
+        let hash = CString::new("blake3").unwrap();
+        let profile = CString::new("balanced").unwrap();
+        let air = toy_air_path();
+        let inputs = CString::new("{\"a\":1,\"b\":[2,3]}").unwrap();
+
+        let mut proof_ptr: *mut u8 = ptr::null_mut();
+        let mut proof_len: u64 = 0;
+        let mut prove_meta = ZkpProveMeta::default();
+        let status = unsafe {
+            zkp_prove_into(
+                backend.as_ptr(),
+                field.as_ptr(),
+                hash.as_ptr(),
+                2,
+                profile.as_ptr(),
+                air.as_ptr(),
+                inputs.as_ptr(),
+                &mut proof_ptr,
+                &mut proof_len,
+                &mut prove_meta,
+            )
+        };
+        assert_eq!(status, ZKP_OK);
+        assert!(!proof_ptr.is_null());
+        assert_eq!(prove_meta.proof_len, proof_len);
+        let proof = unsafe { slice::from_raw_parts(proof_ptr, proof_len as usize) };
+        let header = ProofHeader::decode(&proof[0..40]).unwrap();
+        assert_eq!(prove_meta.digest, digest_D(&header, &proof[40..]));
+
+        let mut verify_meta = ZkpVerifyMeta::default();
+        let status = unsafe {
+            zkp_verify_into(
+                backend.as_ptr(),
+                field.as_ptr(),
+                hash.as_ptr(),
+                2,
+                profile.as_ptr(),
+                air.as_ptr(),
+                inputs.as_ptr(),
+                proof_ptr as *const u8,
+                proof_len,
+                &mut verify_meta,
+            )
+        };
+        assert_eq!(status, ZKP_OK);
+        assert_eq!(
+            verify_meta,
+            ZkpVerifyMeta {
+                digest: prove_meta.digest,
+                verified: 1,
+            }
+        );
+
+        let status = unsafe {
+            zkp_verify_into(
+                backend.as_ptr(),
+                field.as_ptr(),
+                hash.as_ptr(),
+                2,
+                profile.as_ptr(),
+                air.as_ptr(),
+                inputs.as_ptr(),
+                proof_ptr as *const u8,
+                proof_len,
+                ptr::null_mut(),
+            )
+        };
+        assert_eq!(status, ZKP_ERR_INVALID_ARG);
+
+        zkp_free(proof_ptr.cast());
+    }
+
+    #[test]
+    fn bootstrap_matches_list_calls() {
+        let mut backends_ptr: *mut c_char = ptr::null_mut();
+        let mut profiles_ptr: *mut c_char = ptr::null_mut();
+        assert_eq!(
+            unsafe { zkp_bootstrap(&mut backends_ptr, &mut profiles_ptr) },
+            ZKP_OK
+        );
+        assert!(!backends_ptr.is_null() && !profiles_ptr.is_null());
+        let backends = unsafe { CStr::from_ptr(backends_ptr) }.to_owned();
+        let profiles = unsafe { CStr::from_ptr(profiles_ptr) }.to_owned();
+        zkp_free(backends_ptr.cast());
+        zkp_free(profiles_ptr.cast());
+
+        let mut listed: *mut c_char = ptr::null_mut();
+        assert_eq!(unsafe { zkp_list_backends(&mut listed) }, ZKP_OK);
+        assert_eq!(
+            parse_cstring(backends),
+            parse_cstring(unsafe { CStr::from_ptr(listed) }.to_owned())
+        );
+        zkp_free(listed.cast());
+        assert_eq!(unsafe { zkp_list_profiles(&mut listed) }, ZKP_OK);
+        assert_eq!(
+            parse_cstring(profiles),
+            parse_cstring(unsafe { CStr::from_ptr(listed) }.to_owned())
+        );
+        zkp_free(listed.cast());
+
+        let status = unsafe { zkp_bootstrap(ptr::null_mut(), &mut profiles_ptr) };
+        assert_eq!(status, ZKP_ERR_INVALID_ARG);
+    }
+
+    #[test]
+    fn batch_calls_report_status_per_request() {
+        let backend = CString::new("native@0.0").unwrap();
+        let field = CString::new("Prime254").unwrap();
+        let hash = CString::new("blake3").unwrap();
+        let profile = CString::new("balanced").unwrap();
+        let air = toy_air_path();
+        let inputs = CString::new("{\"a\":1,\"b\":[2,3]}").unwrap();
+        let empty = CString::new("").unwrap();
+
+        let req = |profile_id: *const c_char| ZkpProveReq {
+            backend_id: backend.as_ptr(),
+            field: field.as_ptr(),
+            hash_id: hash.as_ptr(),
+            fri_arity: 2,
+            profile_id,
+            air_path: air.as_ptr(),
+            public_inputs_json: inputs.as_ptr(),
+        };
+        let reqs = [req(profile.as_ptr()), req(empty.as_ptr())];
+        let mut out = [
+            ZkpProveResp::failed(ErrorCode::Internal),
+            ZkpProveResp::failed(ErrorCode::Internal),
+        ];
+        let status = unsafe { zkp_prove_batch(reqs.as_ptr(), 2, out.as_mut_ptr()) };
+        assert_eq!(status, ZKP_OK);
+        assert_eq!(out[0].code, ZKP_OK);
+        assert!(!out[0].proof.is_null() && out[0].meta.proof_len > 0);
+        assert_eq!(out[1].code, ZKP_ERR_INVALID_ARG);
+        assert!(out[1].proof.is_null());
+        assert_eq!(out[1].meta, ZkpProveMeta::default());
+
+        let verify_reqs = [ZkpVerifyReq {
+            backend_id: backend.as_ptr(),
+            field: field.as_ptr(),
+            hash_id: hash.as_ptr(),
+            fri_arity: 2,
+            profile_id: profile.as_ptr(),
+            air_path: air.as_ptr(),
+            public_inputs_json: inputs.as_ptr(),
+            proof: out[0].proof,
+            proof_len: out[0].meta.proof_len,
+        }];
+        let mut verify_out = [ZkpVerifyResp {
+            code: ZKP_ERR_INTERNAL,
+            meta: ZkpVerifyMeta::default(),
+        }];
+        let status = unsafe { zkp_verify_batch(verify_reqs.as_ptr(), 1, verify_out.as_mut_ptr()) };
+        assert_eq!(status, ZKP_OK);
+        assert_eq!(verify_out[0].code, ZKP_OK);
+        assert_eq!(
+            verify_out[0].meta,
+            ZkpVerifyMeta {
+                digest: out[0].meta.digest,
+                verified: 1,
+            }
+        );
+
+        zkp_free(out[0].proof.cast());
+
+        let status = unsafe { zkp_prove_batch(ptr::null(), 1, out.as_mut_ptr()) };
+        assert_eq!(status, ZKP_ERR_INVALID_ARG);
+        let status = unsafe { zkp_prove_batch(ptr::null(), 0, ptr::null_mut()) };
+        assert_eq!(status, ZKP_OK);
+    }
+
     #[test]
     fn zkp_free_is_idempotent() {
         let ptr = zkp_alloc(64);
@@ -6,6 +6,7 @@ use std::path::{Path, PathBuf};
 
 type InitFn = unsafe extern "C" fn() -> i32;
 type ListFn = unsafe extern "C" fn(*mut *mut c_char) -> i32;
+type BootstrapFn = unsafe extern "C" fn(*mut *mut c_char, *mut *mut c_char) -> i32;
 type ProveFn = unsafe extern "C" fn(
     *const c_char,
     *const c_char,
@@ -30,6 +31,32 @@ type VerifyFn = unsafe extern "C" fn(
     u64,
     *mut *mut c_char,
 ) -> i32;
+type ProveIntoFn = unsafe extern "C" fn(
+    *const c_char,
+    *const c_char,
+    *const c_char,
+    u32,
+    *const c_char,
+    *const c_char,
+    *const c_char,
+    *mut *mut u8,
+    *mut u64,
+    *mut c_void,
+) -> i32;
+type VerifyIntoFn = unsafe extern "C" fn(
+    *const c_char,
+    *const c_char,
+    *const c_char,
+    u32,
+    *const c_char,
+    *const c_char,
+    *const c_char,
+    *const u8,
+    u64,
+    *mut c_void,
+) -> i32;
+// Request/response structs are passed by pointer; only symbol presence is checked.
+type BatchFn = unsafe extern "C" fn(*const c_void, u64, *mut c_void) -> i32;
 type AllocFn = unsafe extern "C" fn(u64) -> *mut c_void;
 type FreeFn = unsafe extern "C" fn(*mut c_void);
 
@@ -89,12 +116,22 @@ fn exports_expected_symbols() {
             .expect("zkp_list_backends missing");
         lib.get::<ListFn>(b"zkp_list_profiles\0")
             .expect("zkp_list_profiles missing");
+        lib.get::<BootstrapFn>(b"zkp_bootstrap\0")
+            .expect("zkp_bootstrap missing");
         lib.get::<ListFn>(b"zkp_version\0")
             .expect("zkp_version missing");
         lib.get::<ProveFn>(b"zkp_prove\0")
             .expect("zkp_prove missing");
         lib.get::<VerifyFn>(b"zkp_verify\0")
             .expect("zkp_verify missing");
+        lib.get::<ProveIntoFn>(b"zkp_prove_into\0")
+            .expect("zkp_prove_into missing");
+        lib.get::<VerifyIntoFn>(b"zkp_verify_into\0")
+            .expect("zkp_verify_into missing");
+        lib.get::<BatchFn>(b"zkp_prove_batch\0")
+            .expect("zkp_prove_batch missing");
+        lib.get::<BatchFn>(b"zkp_verify_batch\0")
+            .expect("zkp_verify_batch missing");
         lib.get::<AllocFn>(b"zkp_alloc\0")
             .expect("zkp_alloc missing");
         lib.get::<FreeFn>(b"zkp_free\0").expect("zkp_free missing");
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 import zkprov
@@ -8,15 +9,15 @@ import zkprov
 def main() -> int:
     air_path = (Path(__file__).resolve().parents[1] / "air/toy.air").resolve()
     backends = zkprov.list_backends()
-    if isinstance(backends, dict):
+    if isinstance(backends, Mapping):
         backend_names = sorted(backends.keys())
     else:
         backend_names = sorted(
             item.get("id")
             for item in backends
-            if isinstance(item, dict) and item.get("id")
+            if isinstance(item, Mapping) and item.get("id")
         )
-    cfg = dict(
+    cfg = zkprov.ProveConfig(
         backend_id="native@0.0",
         field="Prime254",
         hash_id="blake3",
@@ -27,10 +28,10 @@ def main() -> int:
     )
 
     print("backends:", ", ".join(backend_names))
-    proof, meta = zkprov.prove(**cfg)
-    print("digest:", meta.get("digest"), "len:", meta.get("proof_len"))
-    ok, meta2 = zkprov.verify(proof=proof, **cfg)
-    print("verified:", ok, "digest2:", meta2.get("digest"))
+    proof, meta = zkprov.prove(cfg)
+    print("digest:", meta.digest, "len:", meta.proof_len)
+    ok, meta2 = zkprov.verify(cfg, proof=proof)
+    print("verified:", ok, "digest2:", meta2.digest)
     return 0 if ok else 1
 
 
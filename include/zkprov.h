@@ -54,6 +54,16 @@ int32_t zkp_list_backends(char **out_json);
  */
 int32_t zkp_list_profiles(char **out_json);
 
+/**
+ * Initialize the runtime and retrieve both listings in a single call.
+ *
+ * Equivalent to zkp_init followed by zkp_list_backends and zkp_list_profiles.
+ * On success, *out_backends and *out_profiles receive heap-allocated,
+ * NUL-terminated UTF-8 JSON strings that the caller must release via
+ * zkp_free. On failure, both are set to NULL when the pointers are valid.
+ */
+int32_t zkp_bootstrap(char **out_backends, char **out_profiles);
+
 /**
  * Retrieve the semantic version of the prover runtime.
  *
@@ -111,6 +121,115 @@ int32_t zkp_verify(
     char **out_json_meta
 );
 
+/** Fixed-layout metadata written by zkp_prove_into (40 bytes, no padding). */
+typedef struct ZkpProveMeta {
+    uint8_t digest[32];
+    uint64_t proof_len;
+} ZkpProveMeta;
+
+/** Fixed-layout metadata written by zkp_verify_into (33 bytes, no padding). */
+typedef struct ZkpVerifyMeta {
+    uint8_t digest[32];
+    uint8_t verified;
+} ZkpVerifyMeta;
+
+/**
+ * Variant of zkp_prove that reports metadata through a caller-owned struct
+ * instead of an allocated JSON envelope.
+ *
+ * Proof ownership rules match zkp_prove. On success *out_meta receives the raw
+ * 32-byte digest (the JSON envelope's `digest` without hex encoding) and the
+ * proof length. On failure *out_meta is zeroed.
+ */
+int32_t zkp_prove_into(
+    const char *backend_id,
+    const char *field,
+    const char *hash_id,
+    uint32_t fri_arity,
+    const char *profile_id,
+    const char *air_path,
+    const char *public_inputs_json,
+    uint8_t **out_proof,
+    uint64_t *out_proof_len,
+    ZkpProveMeta *out_meta
+);
+
+/**
+ * Variant of zkp_verify that reports metadata through a caller-owned struct.
+ * On success *out_meta receives the raw digest and verified = 1; on failure it
+ * is zeroed.
+ */
+int32_t zkp_verify_into(
+    const char *backend_id,
+    const char *field,
+    const char *hash_id,
+    uint32_t fri_arity,
+    const char *profile_id,
+    const char *air_path,
+    const char *public_inputs_json,
+    const uint8_t *proof_ptr,
+    uint64_t proof_len,
+    ZkpVerifyMeta *out_meta
+);
+
+/** One request of a zkp_prove_batch call; fields mirror zkp_prove. */
+typedef struct ZkpProveReq {
+    const char *backend_id;
+    const char *field;
+    const char *hash_id;
+    uint32_t fri_arity;
+    const char *profile_id;
+    const char *air_path;
+    const char *public_inputs_json;
+} ZkpProveReq;
+
+/**
+ * Outcome of one ZkpProveReq. On success (code == ZKP_OK) the caller owns
+ * proof (meta.proof_len bytes) and releases it with zkp_free; otherwise proof
+ * is NULL and meta is zeroed.
+ */
+typedef struct ZkpProveResp {
+    int32_t code;
+    uint8_t *proof;
+    ZkpProveMeta meta;
+} ZkpProveResp;
+
+/** One request of a zkp_verify_batch call; fields mirror zkp_verify. */
+typedef struct ZkpVerifyReq {
+    const char *backend_id;
+    const char *field;
+    const char *hash_id;
+    uint32_t fri_arity;
+    const char *profile_id;
+    const char *air_path;
+    const char *public_inputs_json;
+    const uint8_t *proof;
+    uint64_t proof_len;
+} ZkpVerifyReq;
+
+/**
+ * Outcome of one ZkpVerifyReq. On success (code == ZKP_OK) meta holds the raw
+ * digest and verified = 1; otherwise it is zeroed. Nothing needs freeing.
+ */
+typedef struct ZkpVerifyResp {
+    int32_t code;
+    ZkpVerifyMeta meta;
+} ZkpVerifyResp;
+
+/**
+ * Run zkp_prove for each of the n requests in reqs, writing one response per
+ * request to out (caller-owned, n entries). The return value only reports
+ * invalid arguments (reqs or out NULL while n > 0); each request's status is
+ * stored in its response, so one failure does not abort the others.
+ */
+int32_t zkp_prove_batch(const ZkpProveReq *reqs, uint64_t n, ZkpProveResp *out);
+
+/**
+ * Run zkp_verify for each of the n requests in reqs; the contract matches
+ * zkp_prove_batch.
+ */
+int32_t zkp_verify_batch(const ZkpVerifyReq *reqs, uint64_t n, ZkpVerifyResp *out);
+
 /**
  * Allocate a buffer owned by the prover runtime. Callers must eventually
  * release any non-NULL pointer returned from this function with zkp_free.